@@ -16,6 +16,8 @@ const forbiddenRuntimeTerms = [
   /\bsecret\b/i,
 ];
 
+const forbiddenRuntimeTermPattern = new RegExp(forbiddenRuntimeTerms.map((pattern) => pattern.source).join("|"), "i");
+
 export function apiSuccess<T>(data: T): WorkspaceApiSuccess<T> {
   return {
     ok: true,
@@ -39,13 +41,7 @@ export function unwrapApiResult<T>(result: WorkspaceApiResult<T>): T {
 }
 
 export function assertProductSafePayload(value: unknown): void {
-  const text = JSON.stringify(value);
-  if (!text) return;
-  for (const pattern of forbiddenRuntimeTerms) {
-    if (pattern.test(text)) {
-      throw new Error("Runtime API payload contains implementation vocabulary.");
-    }
-  }
+  assertProductSafeText(JSON.stringify(value));
 }
 
 export class WorkspaceApiClientError extends Error {
@@ -66,9 +62,15 @@ export function normalizeRuntimeError(error: unknown): WorkspaceApiFailure {
 
 export function cloneApiPayload<T>(value: T): T {
   if (value === undefined) return value;
-  const cloned = JSON.parse(JSON.stringify(value)) as T;
-  assertProductSafePayload(cloned);
-  return cloned;
+  const text = JSON.stringify(value);
+  assertProductSafeText(text);
+  return JSON.parse(text) as T;
+}
+
+function assertProductSafeText(text: string | undefined): void {
+  if (text && forbiddenRuntimeTermPattern.test(text)) {
+    throw new Error("Runtime API payload contains implementation vocabulary.");
+  }
 }
 
 function safeErrorMessage(message: string): string {
@@ -38,12 +38,18 @@ export function fundamentalSnapshotToEvidenceProposals(
 ): FinancialEvidenceProposal[] {
   if (!result.data) return [];
 
+  const stale = result.status === "stale";
+  const thresholdsByMetric = new Map<string, MetricThreshold[]>();
+  for (const threshold of thresholds) {
+    const forMetric = thresholdsByMetric.get(threshold.metricKey);
+    if (forMetric) forMetric.push(threshold);
+    else thresholdsByMetric.set(threshold.metricKey, [threshold]);
+  }
+
   const proposals: FinancialEvidenceProposal[] = [];
   for (const metric of result.data.metrics) {
-    const matchingThresholds = thresholds.filter((threshold) => threshold.metricKey === metric.key);
-    for (const threshold of matchingThresholds) {
+    for (const threshold of thresholdsByMetric.get(metric.key) ?? []) {
       if (!crossesThreshold(metric.value, threshold.operator, threshold.threshold)) continue;
-      const stale = result.status === "stale";
       proposals.push({
         id: `proposal-${result.data.symbol}-${metric.key}-${threshold.assumptionId}`,
         kind: "fundamental_snapshot",
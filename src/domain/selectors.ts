@@ -9,6 +9,20 @@ import type {
   WorkspaceData,
 } from "./types";
 
+const impactLabels: Readonly<Record<Impact, string>> = {
+  supports: "Supports",
+  contradicts: "Counter-evidence",
+  neutral: "Neutral",
+  unclear: "Unclear",
+};
+
+const statusLabels: Readonly<Record<AssumptionStatus, string>> = {
+  holding: "Holding",
+  weakening: "Weakening",
+  broken: "Broken",
+  uncertain: "Uncertain",
+};
+
 export function convictionBand(score: number): ConvictionBand {
   if (score >= 67) return "high";
   if (score >= 34) return "medium";
@@ -58,7 +72,8 @@ export function evidenceForThesis(data: WorkspaceData, thesisId: string, status?
 }
 
 export function watchlistWithoutThesis(data: WorkspaceData) {
-  return data.assets.filter((asset) => !data.theses.some((thesis) => thesis.assetId === asset.id));
+  const assetIdsWithThesis = new Set(data.theses.map((thesis) => thesis.assetId));
+  return data.assets.filter((asset) => !assetIdsWithThesis.has(asset.id));
 }
 
 export function assumptionStatusCounts(thesis: Thesis): Record<AssumptionStatus, number> {
@@ -76,23 +91,11 @@ export function hasCitationOrUncertainty(item: Evidence): boolean {
 }
 
 export function impactLabel(impact: Impact): string {
-  const labels: Record<Impact, string> = {
-    supports: "Supports",
-    contradicts: "Counter-evidence",
-    neutral: "Neutral",
-    unclear: "Unclear",
-  };
-  return labels[impact];
+  return impactLabels[impact];
 }
 
 export function statusLabel(status: AssumptionStatus): string {
-  const labels: Record<AssumptionStatus, string> = {
-    holding: "Holding",
-    weakening: "Weakening",
-    broken: "Broken",
-    uncertain: "Uncertain",
-  };
-  return labels[status];
+  return statusLabels[status];
 }
 
 export function timeAgo(nowIso: string, thenIso: string): string {
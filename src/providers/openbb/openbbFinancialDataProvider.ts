@@ -256,18 +256,20 @@ function safeProviderMessage(symbol: string, code: ProviderErrorCode): string {
 }
 
 function observedAtFromData(data: unknown): string | null {
-  if (Array.isArray(data)) {
-    const dates = data.map((item) => observedAtFromData(item)).filter((item): item is string => Boolean(item));
-    return dates[0] ?? null;
-  }
+  if (Array.isArray(data)) return firstObservedAt(data);
   if (!data || typeof data !== "object") return null;
   const record = data as Record<string, unknown>;
   const direct = stringValue(record, ["observed_at", "observedAt", "date", "as_of", "period_ending", "fiscalPeriod"]);
   if (direct) return direct;
   const metrics = record.metrics;
-  if (Array.isArray(metrics)) {
-    const dates = metrics.map((item) => observedAtFromData(item)).filter((item): item is string => Boolean(item));
-    return dates[0] ?? null;
+  if (Array.isArray(metrics)) return firstObservedAt(metrics);
+  return null;
+}
+
+function firstObservedAt(items: unknown[]): string | null {
+  for (const item of items) {
+    const observedAt = observedAtFromData(item);
+    if (observedAt) return observedAt;
   }
   return null;
 }
@@ -1,15 +1,28 @@
 import { describe, expect, it } from "vitest";
+import { initialWorkspace } from "../data/fixtures";
 import { MockFinancialDataProvider } from "../data/mockFinancialDataProvider";
 import { defaultMetricThresholds } from "../data/providerRules";
-import type { FinancialDataProvider, FundamentalSnapshot, Period, ProviderResult } from "../domain/financialData";
+import type {
+  FinancialDataProvider,
+  FundamentalSnapshot,
+  Period,
+  PriceSnapshot,
+  ProviderResult,
+} from "../domain/financialData";
+import type { WorkspaceData } from "../domain/types";
 import { FixtureWorkspaceRepository } from "../repositories/fixtureWorkspaceRepository";
 import { ProviderEvidenceService } from "./providerEvidenceService";
-
-function createService(provider: FinancialDataProvider = new MockFinancialDataProvider()) {
-  const repository = new FixtureWorkspaceRepository();
+import type { ProviderEvidenceServiceOptions } from "./providerEvidenceService";
+
+function createService(
+  provider: FinancialDataProvider = new MockFinancialDataProvider(),
+  seed?: WorkspaceData,
+  options?: ProviderEvidenceServiceOptions,
+) {
+  const repository = new FixtureWorkspaceRepository(seed);
   return {
     repository,
-    service: new ProviderEvidenceService(repository, provider, defaultMetricThresholds),
+    service: new ProviderEvidenceService(repository, provider, defaultMetricThresholds, options),
   };
 }
 
@@ -76,6 +89,77 @@ describe("ProviderEvidenceService", () => {
     expect(after.decisionTrace).toHaveLength(before.decisionTrace.length);
   });
 
+  it("resolves duplicate thesis ids to the first thesis in the workspace", async () => {
+    const ngscThesis = initialWorkspace.theses[0];
+    const seed = { ...initialWorkspace, theses: [...initialWorkspace.theses, { ...ngscThesis, assetId: "mdsr" }] };
+    const { service } = createService(new MockFinancialDataProvider(), seed);
+
+    const result = await service.refreshEvidence({ symbols: ["NGSC"] });
+
+    expect(result.added.length).toBeGreaterThan(0);
+    expect(result.added.every((item) => item.classification.assetId === "ngsc")).toBe(true);
+  });
+
+  it("resolves duplicate tickers to the first tracked asset", async () => {
+    const seed = {
+      ...initialWorkspace,
+      assets: [...initialWorkspace.assets, { id: "ngsc_listing", name: "NovaGrid listing", ticker: "NGSC", kind: "equity" as const }],
+    };
+    const { service } = createService(new MockFinancialDataProvider(), seed);
+
+    const result = await service.refreshEvidence({ symbols: ["NGSC"] });
+
+    expect(result.added.map((item) => item.id)).toContain("ev_provider_ngsc_gross_margin_a_ngsc_3_fy2027-q1");
+  });
+
+  it("resolves thesis symbols through the first asset with a given id", async () => {
+    const seed = {
+      ...initialWorkspace,
+      assets: [...initialWorkspace.assets, { id: "ngsc", name: "NovaGrid listing", ticker: "NGSX", kind: "equity" as const }],
+    };
+    const { service } = createService(new MockFinancialDataProvider(), seed);
+
+    const result = await service.refreshEvidence();
+
+    expect(result.rejected.map((item) => item.symbol)).not.toContain("NGSX");
+    expect(result.added.map((item) => item.id)).toContain("ev_provider_ngsc_gross_margin_a_ngsc_3_fy2027-q1");
+  });
+
+  it("keeps input order and skips provider calls for untracked symbols", async () => {
+    const provider = new RecordingFinancialDataProvider();
+    const { service } = createService(provider);
+
+    const result = await service.refreshEvidence({ symbols: ["RETL", "ZZZZ", "NGSC"] });
+
+    expect(result.contexts.map((context) => context.symbol)).toEqual(["RETL", "NGSC"]);
+    expect(result.rejected.map((item) => [item.symbol, item.reason])).toEqual([["ZZZZ", "untracked_asset"]]);
+    expect(result.added[0]?.id).toContain("_retl_");
+    expect(result.added[result.added.length - 1]?.id).toContain("_ngsc_");
+    expect(provider.calls).not.toContain("ZZZZ");
+  });
+
+  it("bounds how many symbols are loaded from the provider at once", async () => {
+    const provider = new RecordingFinancialDataProvider();
+    const { service } = createService(provider, undefined, { maxConcurrentSymbols: 2 });
+
+    await service.refreshEvidence({ symbols: ["NGSC", "RETL", "BCON", "MDSR"] });
+
+    expect(provider.calls).toHaveLength(8);
+    expect(provider.maxSymbolsInFlight).toBe(2);
+  });
+
+  it("loads each symbol once when it is requested more than once", async () => {
+    const provider = new RecordingFinancialDataProvider();
+    const { service } = createService(provider);
+
+    const result = await service.refreshEvidence({ symbols: ["NGSC", "RETL", "NGSC"] });
+    const addedIds = result.added.map((item) => item.id);
+
+    expect(provider.calls.filter((symbol) => symbol === "NGSC")).toHaveLength(2);
+    expect(result.contexts.map((context) => context.symbol)).toEqual(["NGSC", "RETL"]);
+    expect(new Set(addedIds).size).toBe(addedIds.length);
+  });
+
   it("blocks advice-like provider-derived candidates", async () => {
     const provider = new AdviceLikeFundamentalsProvider();
     const { service } = createService(provider);
@@ -100,3 +184,31 @@ class AdviceLikeFundamentalsProvider extends MockFinancialDataProvider {
     };
   }
 }
+
+class RecordingFinancialDataProvider extends MockFinancialDataProvider {
+  readonly calls: string[] = [];
+  maxSymbolsInFlight = 0;
+  private readonly inFlight = new Map<string, number>();
+
+  async getPriceSnapshot(symbol: string): Promise<ProviderResult<PriceSnapshot>> {
+    return this.record(symbol, () => super.getPriceSnapshot(symbol));
+  }
+
+  async getFundamentals(symbol: string, period: Period): Promise<ProviderResult<FundamentalSnapshot>> {
+    return this.record(symbol, () => super.getFundamentals(symbol, period));
+  }
+
+  private async record<T>(symbol: string, load: () => Promise<T>): Promise<T> {
+    this.calls.push(symbol);
+    this.inFlight.set(symbol, (this.inFlight.get(symbol) ?? 0) + 1);
+    this.maxSymbolsInFlight = Math.max(this.maxSymbolsInFlight, this.inFlight.size);
+    try {
+      await new Promise((resolve) => setTimeout(resolve, 0));
+      return await load();
+    } finally {
+      const remaining = (this.inFlight.get(symbol) ?? 1) - 1;
+      if (remaining === 0) this.inFlight.delete(symbol);
+      else this.inFlight.set(symbol, remaining);
+    }
+  }
+}
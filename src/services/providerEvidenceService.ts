@@ -2,8 +2,11 @@ import type {
   FinancialContext,
   FinancialDataProvider,
   FinancialEvidenceProposal,
+  FundamentalSnapshot,
   MetricThreshold,
   Period,
+  PriceSnapshot,
+  ProviderResult,
 } from "../domain/financialData";
 import {
   fundamentalSnapshotToEvidenceProposals,
@@ -31,24 +34,45 @@ export interface ProviderEvidenceRejection {
   message: string;
 }
 
+export interface ProviderEvidenceServiceOptions {
+  maxConcurrentSymbols?: number;
+}
+
+type SymbolProviderResults = [ProviderResult<PriceSnapshot>, ProviderResult<FundamentalSnapshot>];
+
+const DEFAULT_MAX_CONCURRENT_SYMBOLS = 4;
+
 export class ProviderEvidenceService {
+  private readonly maxConcurrentSymbols: number;
+
   constructor(
     private readonly repository: WorkspaceRepository,
     private readonly provider: FinancialDataProvider,
     private readonly thresholds: MetricThreshold[],
-  ) {}
+    options: ProviderEvidenceServiceOptions = {},
+  ) {
+    this.maxConcurrentSymbols = Math.max(1, options.maxConcurrentSymbols ?? DEFAULT_MAX_CONCURRENT_SYMBOLS);
+  }
 
   async refreshEvidence(input: ProviderEvidenceRefreshInput = {}): Promise<ProviderEvidenceRefreshResult> {
     const workspace = await this.repository.getWorkspace();
-    const symbols = input.symbols ?? symbolsWithTheses(workspace);
+    const symbols = [...new Set(input.symbols ?? symbolsWithTheses(workspace))];
     const period = input.period ?? "quarterly";
     const candidates: Evidence[] = [];
     const contexts: FinancialContext[] = [];
     const rejected: ProviderEvidenceRejection[] = [];
+    const thesesById = indexFirstBy(workspace.theses, (thesis) => thesis.id);
+    const thresholdsByAsset = groupThresholdsByAsset(thesesById, this.thresholds);
+    const assetsByTicker = indexFirstBy(workspace.assets, (asset) => asset.ticker);
+    const providerResults = await this.loadProviderResults(
+      symbols.filter((symbol) => assetsByTicker.has(symbol)),
+      period,
+    );
 
     for (const symbol of symbols) {
-      const asset = workspace.assets.find((candidate) => candidate.ticker === symbol);
-      if (!asset) {
+      const asset = assetsByTicker.get(symbol);
+      const results = providerResults.get(symbol);
+      if (!asset || !results) {
         rejected.push({
           symbol,
           reason: "untracked_asset",
@@ -57,10 +81,9 @@ export class ProviderEvidenceService {
         continue;
       }
 
-      const priceResult = await this.provider.getPriceSnapshot(symbol);
+      const [priceResult, fundamentalsResult] = results;
       contexts.push(priceSnapshotToContext(priceResult));
 
-      const fundamentalsResult = await this.provider.getFundamentals(symbol, period);
       if (!fundamentalsResult.data) {
         contexts.push(providerUnavailableToContext(symbol, fundamentalsResult.message ?? "Fundamental data unavailable."));
         rejected.push({
@@ -71,7 +94,7 @@ export class ProviderEvidenceService {
         continue;
       }
 
-      const thresholdsForSymbol = thresholdsForAsset(workspace, asset.id, this.thresholds);
+      const thresholdsForSymbol = thresholdsByAsset.get(asset.id) ?? [];
       const proposals = fundamentalSnapshotToEvidenceProposals(fundamentalsResult, thresholdsForSymbol);
       for (const proposal of proposals) {
         const rejection = validateProposal(proposal);
@@ -79,24 +102,50 @@ export class ProviderEvidenceService {
           rejected.push({ symbol, ...rejection });
           continue;
         }
-        candidates.push(proposalToEvidence(proposal, workspace));
+        candidates.push(proposalToEvidence(proposal, thesesById));
       }
     }
 
     const added = await this.repository.appendEvidenceCandidates(candidates);
     return { added, rejected, contexts };
   }
+
+  private async loadProviderResults(symbols: string[], period: Period): Promise<Map<string, SymbolProviderResults>> {
+    const results = new Map<string, SymbolProviderResults>();
+    let next = 0;
+    const worker = async () => {
+      while (next < symbols.length) {
+        const symbol = symbols[next++];
+        results.set(
+          symbol,
+          await Promise.all([this.provider.getPriceSnapshot(symbol), this.provider.getFundamentals(symbol, period)]),
+        );
+      }
+    };
+
+    const workers = Math.min(this.maxConcurrentSymbols, symbols.length);
+    await Promise.all(Array.from({ length: workers }, () => worker()));
+    return results;
+  }
 }
 
 function symbolsWithTheses(workspace: WorkspaceData): string[] {
+  const assetsById = indexFirstBy(workspace.assets, (asset) => asset.id);
   return workspace.theses
-    .map((thesis) => workspace.assets.find((asset) => asset.id === thesis.assetId)?.ticker)
+    .map((thesis) => assetsById.get(thesis.assetId)?.ticker)
     .filter((symbol): symbol is string => Boolean(symbol));
 }
 
-function thresholdsForAsset(workspace: WorkspaceData, assetId: string, thresholds: MetricThreshold[]): MetricThreshold[] {
-  const thesisIds = new Set(workspace.theses.filter((thesis) => thesis.assetId === assetId).map((thesis) => thesis.id));
-  return thresholds.filter((threshold) => thesisIds.has(threshold.thesisId));
+function groupThresholdsByAsset(thesesById: Map<string, Thesis>, thresholds: MetricThreshold[]): Map<string, MetricThreshold[]> {
+  const grouped = new Map<string, MetricThreshold[]>();
+  for (const threshold of thresholds) {
+    const assetId = thesesById.get(threshold.thesisId)?.assetId;
+    if (!assetId) continue;
+    const forAsset = grouped.get(assetId);
+    if (forAsset) forAsset.push(threshold);
+    else grouped.set(assetId, [threshold]);
+  }
+  return grouped;
 }
 
 function validateProposal(
@@ -119,8 +168,8 @@ function validateProposal(
   return null;
 }
 
-function proposalToEvidence(proposal: FinancialEvidenceProposal, workspace: WorkspaceData): Evidence {
-  const thesis = requireThesis(workspace, proposal.thesisId);
+function proposalToEvidence(proposal: FinancialEvidenceProposal, thesesById: Map<string, Thesis>): Evidence {
+  const thesis = requireThesis(thesesById, proposal.thesisId);
   const source = sourceFromProposal(proposal);
   return {
     id: evidenceIdForProposal(proposal),
@@ -158,8 +207,17 @@ function evidenceIdForProposal(proposal: FinancialEvidenceProposal): string {
   return `ev_provider_${proposal.symbol.toLowerCase()}_${proposal.metric.key}_${proposal.assumptionId}_${period}`;
 }
 
-function requireThesis(workspace: WorkspaceData, thesisId: string): Thesis {
-  const thesis = workspace.theses.find((candidate) => candidate.id === thesisId);
+function indexFirstBy<T>(items: T[], keyOf: (item: T) => string): Map<string, T> {
+  const index = new Map<string, T>();
+  for (const item of items) {
+    const key = keyOf(item);
+    if (!index.has(key)) index.set(key, item);
+  }
+  return index;
+}
+
+function requireThesis(thesesById: Map<string, Thesis>, thesisId: string): Thesis {
+  const thesis = thesesById.get(thesisId);
   if (!thesis) {
     throw new Error(`Thesis not found for provider proposal: ${thesisId}`);
   }
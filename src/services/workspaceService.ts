@@ -59,19 +59,24 @@ export class WorkspaceService {
       throw new Error(`Thesis not found: ${input.thesisId}`);
     }
 
-    const linkedEvidence = workspace.evidence.filter(
-      (item) => item.status === "accepted" && item.classification.thesisId === input.thesisId,
-    );
+    const evidenceIds: string[] = [];
+    const sources: string[] = [];
+    for (const item of workspace.evidence) {
+      if (item.status !== "accepted" || item.classification.thesisId !== input.thesisId) continue;
+      evidenceIds.push(item.id);
+      if (item.citation) sources.push(item.citation.label);
+    }
+
     const trace = assembleDecisionTrace(
       {
         actor: workspace.user.name,
         decision: input.decision,
         priorConviction: thesis.conviction,
         newConviction: input.newConviction,
-        evidenceIds: linkedEvidence.map((item) => item.id),
+        evidenceIds,
         changedAssumptions: thesis.assumptions.filter((assumption) => assumption.status !== "holding").map((assumption) => assumption.id),
         rationale: input.rationale,
-        sources: linkedEvidence.flatMap((item) => (item.citation ? [item.citation.label] : [])),
+        sources,
         followUp: input.followUp,
         unresolved: [],
       },